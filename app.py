@@ -1,6 +1,8 @@
 import sys
 import os
+import io
 import glob
+import hashlib
 import threading
 import numpy as np
 import sounddevice as sd
@@ -25,6 +27,90 @@ from PyQt6.QtGui import QPixmap, QIcon, QAction
 from PyQt6.QtCore import Qt, QSize, QTimer
 
 
+class SampleStore:
+    """Content-addressed sample cache shared by all loaded kits.
+
+    Samples are keyed by a hash of their file bytes, so identical WAVs in
+    different kits are decoded and held only once. Each kit holds one
+    reference per sample; an entry and its pitch variant are dropped when
+    no loaded kit references it any more.
+    """
+
+    def __init__(self):
+        self._entries = {}  # key -> {"data", "sr", "refs", "pitched": (semitone, data) | None}
+        self._kits = {}     # kit_name -> [key, ...]
+
+    def _acquire(self, path: str) -> str:
+        """Add a reference to the sample at path, decoding it if new."""
+        with open(path, "rb") as f:
+            raw = f.read()
+        key = hashlib.blake2b(raw, digest_size=16).hexdigest()
+        entry = self._entries.get(key)
+        if entry is None:
+            data, sr = sf.read(io.BytesIO(raw), dtype="float32")
+            if data.ndim == 2:
+                data = data.mean(axis=1)
+            entry = {"data": data, "sr": sr, "refs": 0, "pitched": None}
+            self._entries[key] = entry
+        entry["refs"] += 1
+        return key
+
+    def _release(self, key: str):
+        """Drop one reference, freeing the entry when none are left."""
+        entry = self._entries[key]
+        entry["refs"] -= 1
+        if entry["refs"] <= 0:
+            del self._entries[key]
+
+    def load_kit(self, kit_name: str, paths):
+        """Reference the files in paths for kit_name and return their keys."""
+        keys = []
+        try:
+            for path in paths:
+                keys.append(self._acquire(path))
+        except Exception:
+            for key in keys:
+                self._release(key)
+            raise
+        # Acquire before releasing, so reloading a kit does not decode again
+        self.release_kit(kit_name)
+        self._kits[kit_name] = keys
+        return keys
+
+    def release_kit(self, kit_name: str):
+        """Drop all references held by kit_name."""
+        for key in self._kits.pop(kit_name, []):
+            self._release(key)
+
+    def get(self, key: str):
+        """Return (data, sr) of a stored sample."""
+        entry = self._entries[key]
+        return entry["data"], entry["sr"]
+
+    def pitched(self, key: str, semitone: int):
+        """Return the sample resampled by semitone.
+
+        Only the most recently used non-zero variant is kept per entry, so a
+        sample is held at most twice while its dial is off centre.
+        """
+        entry = self._entries[key]
+        data = entry["data"]
+        if semitone == 0:
+            return data
+        cached = entry["pitched"]
+        if cached is not None and cached[0] == semitone:
+            return cached[1]
+        rate = 2 ** (semitone / 12.0)
+        original_length = len(data)
+        new_length = int(np.round(original_length / rate))
+        if new_length < 1:
+            new_length = 1
+        indices = np.linspace(0, original_length - 1, new_length)
+        resampled = np.interp(indices, np.arange(original_length), data).astype("float32")
+        entry["pitched"] = (semitone, resampled)
+        return resampled
+
+
 class DrumMachineGUI(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -53,7 +139,8 @@ class DrumMachineGUI(QMainWindow):
         self.current_kit = self.kit_names[0]
 
         # Prepare containers (empty for now)
-        self.samples = []          # Will hold (name, data, sr)
+        self.samples = []          # Will hold (name, store key), key None if empty
+        self.sample_store = SampleStore()
         self.sample_labels = []
         self.step_buttons = []
         self.vol_dials = []
@@ -436,20 +523,19 @@ class DrumMachineGUI(QMainWindow):
 
     def load_kit(self, kit_name: str):
         """Load exactly 8 .wav samples from 'samples/kit_name'."""
-        self.samples.clear()
         kit_path = os.path.join("samples", kit_name)
-        wav_files = sorted(glob.glob(os.path.join(kit_path, "*.wav")))
+        wav_files = sorted(glob.glob(os.path.join(kit_path, "*.wav")))[:8]
 
-        for path in wav_files[:8]:
-            data, sr = sf.read(path, dtype="float32")
+        # Load into the store first, so a bad file leaves the current kit intact
+        keys = self.sample_store.load_kit(kit_name, wav_files)
+        self.samples.clear()
+        for path, key in zip(wav_files, keys):
             name = os.path.splitext(os.path.basename(path))[0]
-            if data.ndim == 2:
-                data = data.mean(axis=1)
-            self.samples.append((name, data, sr))
+            self.samples.append((name, key))
 
         # Pad with silent if fewer than 8
         while len(self.samples) < 8:
-            self.samples.append((f"Empty {len(self.samples)+1}", np.zeros(1, dtype="float32"), 44100))
+            self.samples.append((f"Empty {len(self.samples)+1}", None))
 
         # Update labels
         for r in range(self.num_rows):
@@ -459,10 +545,14 @@ class DrumMachineGUI(QMainWindow):
         """Switch to a different kit: stop playback, reload samples/labels."""
         if kit_name == self.current_kit:
             return
-        self.current_kit = kit_name
-        self.kit_button.setText(kit_name)
         self.stop_playback()
+        previous_kit = self.current_kit
         self.load_kit(kit_name)
+        self.current_kit = kit_name
+        self.kit_button.setText(kit_name)
+        # Release the old kit only after the new one holds its references,
+        # so samples shared by both kits stay decoded
+        self.sample_store.release_kit(previous_kit)
 
     def increase_tempo(self):
         try:
@@ -586,16 +676,13 @@ class DrumMachineGUI(QMainWindow):
         for row in range(self.num_rows):
             btn = self.step_buttons[row][step_idx]
             if btn.isChecked() and row < len(self.samples):
-                name, data, sr = self.samples[row]
+                key = self.samples[row][1]
+                if key is None:
+                    continue
+                _, sr = self.sample_store.get(key)
                 vol = self.vol_dials[row].value() / 100.0
                 semitone = self.pitch_dials[row].value()
-                rate = 2 ** (semitone / 12.0)
-                original_length = len(data)
-                new_length = int(np.round(original_length / rate))
-                if new_length < 1:
-                    new_length = 1
-                indices = np.linspace(0, original_length - 1, new_length)
-                resampled = np.interp(indices, np.arange(original_length), data).astype("float32")
+                resampled = self.sample_store.pitched(key, semitone)
                 data_to_play = (resampled * vol).astype("float32")
                 threading.Thread(
                     target=self.play_sample, args=(data_to_play, sr), daemon=True
@@ -0,0 +1,104 @@
+import glob
+import os
+
+import pytest
+
+try:
+    import app
+except (ImportError, OSError) as exc:  # sounddevice raises OSError without PortAudio
+    pytest.skip(f"app dependencies unavailable: {exc}", allow_module_level=True)
+
+SampleStore = app.SampleStore
+
+SAMPLES_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "samples")
+SHARED = ["crash", "kick", "sidestick", "tom"]  # byte-identical in Rock and Rock 2
+
+
+def kit_paths(kit_name):
+    return sorted(glob.glob(os.path.join(SAMPLES_DIR, kit_name, "*.wav")))[:8]
+
+
+def keys_by_name(kit_name, keys):
+    names = [os.path.splitext(os.path.basename(p))[0] for p in kit_paths(kit_name)]
+    return dict(zip(names, keys))
+
+
+@pytest.fixture
+def decode_count(monkeypatch):
+    calls = []
+    real_read = app.sf.read
+
+    def counting_read(*args, **kwargs):
+        calls.append(args)
+        return real_read(*args, **kwargs)
+
+    monkeypatch.setattr(app.sf, "read", counting_read)
+    return calls
+
+
+def test_identical_files_share_one_entry(decode_count):
+    store = SampleStore()
+    rock = keys_by_name("Rock", store.load_kit("Rock", kit_paths("Rock")))
+    rock2 = keys_by_name("Rock 2", store.load_kit("Rock 2", kit_paths("Rock 2")))
+
+    for name in SHARED:
+        assert rock[name] == rock2[name]
+    assert len(store._entries) == len(set(rock.values()) | set(rock2.values()))
+    assert len(decode_count) == len(store._entries)
+
+
+def test_release_one_kit_keeps_shared_entries():
+    store = SampleStore()
+    rock = keys_by_name("Rock", store.load_kit("Rock", kit_paths("Rock")))
+    store.load_kit("Rock 2", kit_paths("Rock 2"))
+
+    store.release_kit("Rock")
+
+    for name in SHARED:
+        assert rock[name] in store._entries
+    assert rock["bell"] not in store._entries
+
+
+def test_release_last_kit_frees_entry_and_variants():
+    store = SampleStore()
+    rock = keys_by_name("Rock", store.load_kit("Rock", kit_paths("Rock")))
+    store.load_kit("Rock 2", kit_paths("Rock 2"))
+    store.pitched(rock["kick"], 3)
+    assert store._entries[rock["kick"]]["pitched"][0] == 3
+
+    store.release_kit("Rock")
+    store.release_kit("Rock 2")
+
+    assert store._entries == {}
+
+
+def test_reload_same_kit_does_not_decode_again(decode_count):
+    store = SampleStore()
+    first = store.load_kit("Rock", kit_paths("Rock"))
+    decoded = len(decode_count)
+
+    second = store.load_kit("Rock", kit_paths("Rock"))
+
+    assert second == first
+    assert len(decode_count) == decoded
+    assert all(store._entries[key]["refs"] == 1 for key in second)
+
+
+def test_failed_load_releases_acquired_samples(tmp_path):
+    bad = tmp_path / "broken.wav"
+    bad.write_bytes(b"RIFF\x00\x00")
+    store = SampleStore()
+
+    with pytest.raises(Exception):
+        store.load_kit("Broken", kit_paths("House") + [str(bad)])
+
+    assert store._entries == {}
+
+
+def test_pitch_zero_returns_stored_data():
+    store = SampleStore()
+    key = store.load_kit("House", kit_paths("House"))[0]
+    data, _ = store.get(key)
+
+    assert store.pitched(key, 0) is data
+    assert store._entries[key]["pitched"] is None